@@ -0,0 +1,104 @@
+# ---------------------------------------------------------------------------- #
+#                                PROGRAM HEADER                                #
+# ---------------------------------------------------------------------------- #
+
+# Name          : generate_data.py
+# Description   : Creates synthetic database files (credentials files and manga
+#                 lists) of any size, in the same format as the files in the
+#                 "database" folder. These files are used by the benchmarks in
+#                 "run_benchmarks.py", and can also be created directly, e.g.
+#                 "python benchmarks/generate_data.py lists 10000 out_dir".
+
+
+# ---------------------------------------------------------------------------- #
+#                               IMPORT STATEMENTS                              #
+# ---------------------------------------------------------------------------- #
+
+import os # Used to create the folder that the files are written to
+import random # Used to create varied (but repeatable) data
+import sys # Provides the command-line arguments given to the program
+
+
+# ---------------------------------------------------------------------------- #
+#                              GENERATOR FUNCTIONS                             #
+# ---------------------------------------------------------------------------- #
+
+# Words used to build manga titles
+TITLE_WORDS = ["Dr.", "Stone", "Jujutsu", "Kaisen", "Blue", "Period", "Yuan",
+               "Zun", "Berserk", "Hero", "Academia", "One", "Punch", "Man",
+               "Fire", "Force", "Black", "Clover", "Dragon", "Ball", "Bleach",
+               "Tomodachi", "Game", "Noragami", "no", "Ao", "Futsumashi"]
+
+
+# Function that returns a list of manga entries ([ID number, title, chapter]),
+# using the given random number generator
+def make_manga_entries(entry_count, generator):
+
+    entries = []
+
+    for i in range(entry_count):
+
+        # The ID numbers are unique, so that the lists are valid
+        manga_id = str(i + 1)
+        title_length = generator.randint(1, 4)
+        title = " ".join(generator.choice(TITLE_WORDS)
+                         for word in range(title_length))
+        chapter = str(generator.randint(1, 400))
+
+        entries.append([manga_id, title, chapter])
+
+    return entries
+
+
+# Function to write a manga list file with the given number of entries
+def write_manga_list(filename, entry_count, seed=0):
+
+    generator = random.Random(seed)
+
+    with open(filename, "w") as list_file:
+        for entry in make_manga_entries(entry_count, generator):
+            list_file.write("|".join(entry))
+            list_file.write("\n")
+
+
+# Function to write a credentials file with the given number of users (named
+# "user0", "user1", etc., each with the password "pass" followed by the same
+# number)
+def write_credentials_file(filename, user_count):
+
+    with open(filename, "w") as credentials_file:
+        for i in range(user_count):
+            credentials_file.write("user" + str(i) + "|pass" + str(i) + "\n")
+
+
+# ---------------------------------------------------------------------------- #
+#                                 MAIN FUNCTION                                #
+# ---------------------------------------------------------------------------- #
+
+# Creates either a credentials file ("credentials") or a manga list ("lists")
+# of the given size in the given folder
+def main(arguments):
+
+    if (len(arguments) != 3) or (arguments[0] not in ["credentials", "lists"]):
+        print("usage: generate_data.py {credentials,lists} SIZE FOLDER")
+        return 1
+
+    file_type = arguments[0]
+    size = int(arguments[1])
+    folder = arguments[2]
+
+    os.makedirs(folder, exist_ok=True)
+
+    if file_type == "credentials":
+        filename = os.path.join(folder, "credentials_list.txt")
+        write_credentials_file(filename, size)
+    else:
+        filename = os.path.join(folder, "user" + str(size) + ".txt")
+        write_manga_list(filename, size)
+
+    print("Wrote " + filename)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
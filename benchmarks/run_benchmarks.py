@@ -0,0 +1,264 @@
+# ---------------------------------------------------------------------------- #
+#                                PROGRAM HEADER                                #
+# ---------------------------------------------------------------------------- #
+
+# Name          : run_benchmarks.py
+# Description   : Times Chapter Check's most frequently used operations (finding
+#                 the latest chapter on a manga page, reading search results,
+#                 reading and updating manga lists, and checking logins) without
+#                 making any requests over the internet. The results are
+#                 printed, and saved as JSON so that different runs can be
+#                 compared (e.g. "python benchmarks/run_benchmarks.py --output
+#                 before.json", and later "--output after.json").
+
+
+# ---------------------------------------------------------------------------- #
+#                               IMPORT STATEMENTS                              #
+# ---------------------------------------------------------------------------- #
+
+import argparse # Used to read the options given on the command line
+import json # Used to save the results
+import os # Used to build file paths
+import platform # Used to record which computer and Python version were used
+import statistics # Used to find the median of each benchmark's timings
+import sys # Used to find the main program
+import tempfile # Used to hold the synthetic database files
+import time # Used to time each benchmark
+
+import generate_data # Creates the synthetic database files
+
+# The main program is imported from the folder above this one
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+
+import main as chapter_check
+
+
+# ---------------------------------------------------------------------------- #
+#                               PROGRAM SETTINGS                               #
+# ---------------------------------------------------------------------------- #
+
+# Recorded responses used by the parsing benchmarks
+FIXTURE_DIR = os.path.join(BENCHMARK_DIR, "fixtures")
+SERIES_PAGE_FILE = os.path.join(FIXTURE_DIR, "series_page.html")
+SEARCH_RESULT_FILE = os.path.join(FIXTURE_DIR, "cse_response.json")
+
+# Sizes of the manga lists and credentials files used by the benchmarks (the
+# largest sizes are left out when running with "--quick")
+LIST_SIZES = [10, 100, 1000, 10000, 100000]
+CREDENTIAL_SIZES = [10, 1000, 100000, 1000000]
+QUICK_MAX_SIZE = 10000
+
+
+# ---------------------------------------------------------------------------- #
+#                              BENCHMARK FUNCTIONS                             #
+# ---------------------------------------------------------------------------- #
+
+# Function that calls the given function the given number of times, and returns
+# a dictionary describing how long each call took (in seconds); If a "setup"
+# function is given, it is called (without being timed) before each call
+def time_function(name, size, repeats, function, setup=None):
+
+    timings = []
+
+    for i in range(repeats):
+        if setup != None:
+            setup()
+
+        start_time = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start_time)
+
+    result = {"name": name, "size": size, "repeats": repeats,
+              "best_seconds": min(timings),
+              "median_seconds": statistics.median(timings),
+              "mean_seconds": statistics.mean(timings)}
+
+    print(name.ljust(36) + str(size).rjust(9) + "  best " +
+          format_seconds(result["best_seconds"]) + "  median " +
+          format_seconds(result["median_seconds"]))
+
+    return result
+
+
+# Function that returns a number of seconds in a readable form
+def format_seconds(seconds):
+
+    if seconds < 0.001:
+        return ("%.2f" % (seconds * 1000000)).rjust(8) + " us"
+    elif seconds < 1:
+        return ("%.2f" % (seconds * 1000)).rjust(8) + " ms"
+    else:
+        return ("%.2f" % seconds).rjust(8) + " s "
+
+
+# Function that times finding the latest chapter on a recorded manga page, both
+# from the whole page at once and piece by piece (as when streaming)
+def benchmark_extraction():
+
+    with open(SERIES_PAGE_FILE, "rb") as page_file:
+        page_bytes = page_file.read()
+
+    page_text = page_bytes.decode("utf-8")
+    chunk_size = chapter_check.STREAM_CHUNK_SIZE
+    page_chunks = [page_bytes[i:i + chunk_size]
+                   for i in range(0, len(page_bytes), chunk_size)]
+
+    results = []
+
+    results.append(time_function("extract_latest_chapter", len(page_text),
+                                 2000, lambda: chapter_check.
+                                 extract_latest_chapter(page_text)))
+
+    results.append(time_function("extract_latest_chapter_stream",
+                                 len(page_bytes), 2000, lambda: chapter_check.
+                                 extract_latest_chapter_stream(
+                                     iter(page_chunks))))
+
+    return results
+
+
+# Function that times reading a recorded search result
+def benchmark_search_parsing():
+
+    with open(SEARCH_RESULT_FILE, "r") as search_file:
+        search_result = search_file.read()
+
+    return [time_function("parse_search_result", len(search_result), 5000,
+                          lambda: chapter_check.parse_search_result(
+                              search_result))]
+
+
+# Function that times reading a manga list, and updating a single chapter in
+# it, for each storage backend and list size
+def benchmark_storage(database_dir, list_sizes):
+
+    results = []
+
+    for backend in ["text", "sqlite"]:
+
+        chapter_check.STORAGE_BACKEND = backend
+
+        for size in list_sizes:
+
+            list_owner = "user" + str(size)
+            manga_list = generate_data.make_manga_entries(
+                size, generate_data.random.Random(size))
+
+            # Creates the user's list from scratch in the selected backend
+            chapter_check.create_list(list_owner)
+            chapter_check.update_list(manga_list, list_owner)
+            chapter_check.text_wait_for_compaction()
+
+            repeats = max(3, min(200, 100000 // size))
+
+            results.append(time_function("get_user_list (" + backend + ")",
+                                         size, repeats, lambda: chapter_check.
+                                         get_user_list(list_owner)))
+
+            # Each update changes the chapter of the first manga in the list
+            update_counter = [0]
+
+            def update_one_chapter():
+                update_counter[0] += 1
+                manga_list[0] = [manga_list[0][0], manga_list[0][1],
+                                 str(update_counter[0])]
+                chapter_check.update_list(manga_list, list_owner)
+
+            # Any compaction started by the previous update is finished before
+            # the next one is timed, so that it does not slow the update down
+            results.append(time_function("update_list (" + backend + ")",
+                                         size, repeats, update_one_chapter,
+                                         chapter_check.
+                                         text_wait_for_compaction))
+
+    return results
+
+
+# Function that times checking a login against credentials files of different
+# sizes, both when the file must be read (the first login) and afterwards
+def benchmark_credentials(database_dir, credential_sizes):
+
+    results = []
+
+    for size in credential_sizes:
+
+        credentials_filename = os.path.join(database_dir,
+                                            "credentials_" + str(size) + ".txt")
+        generate_data.write_credentials_file(credentials_filename, size)
+
+        chapter_check.CREDENTIALS_FILE = credentials_filename
+
+        # The last user in the file is the slowest one to find by searching
+        chapter_check.username = "user" + str(size - 1)
+        chapter_check.password = "pass" + str(size - 1)
+
+        # Forces the credentials file to be read again before every login
+        def cold_login():
+            chapter_check.credentials_stamp = None
+            chapter_check.credentials_check()
+
+        results.append(time_function("credentials_check (first login)", size,
+                                     3, cold_login))
+
+        results.append(time_function("credentials_check", size, 1000,
+                                     chapter_check.credentials_check))
+
+    return results
+
+
+# ---------------------------------------------------------------------------- #
+#                                 MAIN FUNCTION                                #
+# ---------------------------------------------------------------------------- #
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Run Chapter Check's "
+                                     "benchmarks (without using the internet)")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="file that the results are saved to")
+    parser.add_argument("--quick", action="store_true",
+                        help="leave out list and credential sizes above " +
+                        str(QUICK_MAX_SIZE))
+    arguments = parser.parse_args()
+
+    list_sizes = LIST_SIZES
+    credential_sizes = CREDENTIAL_SIZES
+
+    if arguments.quick == True:
+        list_sizes = [size for size in list_sizes if size <= QUICK_MAX_SIZE]
+        credential_sizes = [size for size in credential_sizes
+                            if size <= QUICK_MAX_SIZE]
+
+    results = []
+
+    # Every database file is created in a temporary folder, so that the real
+    # database is never touched
+    with tempfile.TemporaryDirectory() as database_dir:
+
+        chapter_check.DATABASE_DIR = database_dir
+        chapter_check.SQLITE_DATABASE_FILE = os.path.join(database_dir,
+                                                          "manga_lists.db")
+
+        results += benchmark_extraction()
+        results += benchmark_search_parsing()
+        results += benchmark_storage(database_dir, list_sizes)
+        results += benchmark_credentials(database_dir, credential_sizes)
+
+        # Waits for any list compaction started by the storage benchmarks to
+        # finish before the folder is deleted
+        chapter_check.text_wait_for_compaction()
+
+    report = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+              "python": platform.python_version(),
+              "platform": platform.platform(),
+              "results": results}
+
+    with open(arguments.output, "w") as output_file:
+        json.dump(report, output_file, indent=2)
+
+    print("Saved results to " + arguments.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+# ---------------------------------------------------------------------------- #
+#                                PROGRAM HEADER                                #
+# ---------------------------------------------------------------------------- #
+
+# Name          : extractor.py
+# Description   : Finds the information that Chapter Check needs within the
+#                 pages it downloads: the latest chapter on a manga's page, and
+#                 the ID number and title of each manga in a search result. The
+#                 patterns used to find this information are compiled once, and
+#                 each page is only searched through a single time; The
+#                 functions below do not change any shared data, so they can be
+#                 used from several threads at once.
+
+
+# ---------------------------------------------------------------------------- #
+#                               IMPORT STATEMENTS                              #
+# ---------------------------------------------------------------------------- #
+
+import json # Used to decode search results
+import re # Used to compile and search for the patterns below
+
+
+# ---------------------------------------------------------------------------- #
+#                                 PATTERN SETS                                 #
+# ---------------------------------------------------------------------------- #
+
+# Note: A pattern set describes where the information is found on a particular
+# version of the website; If the website's layout changes, a new pattern set
+# can be added with the "add_pattern_set" function and selected by changing
+# ACTIVE_PATTERN_SET (or by giving its name to the functions below), without
+# changing any of the code that uses this module.
+
+PATTERN_SETS = {} # Compiled pattern sets, stored by name
+ACTIVE_PATTERN_SET = "mangaupdates" # Pattern set used when none is given
+
+
+# Function used to compile and store a pattern set, where:
+# - "anchor" marks the start of the section of a manga's page that holds the
+#   latest chapter, and "anchor_length" is the longest text it can match
+# - "chapter" matches from the anchor up to the end of the latest chapter, with
+#   the chapter itself in a group named "chapter"; "chapter_end" is the text
+#   that every match of "chapter" ends with, and "section_length" is the
+#   longest text that "chapter" can match (so the pattern must limit how far
+#   it searches past the anchor)
+# - "series_link" matches the link to a manga's page, with the manga's ID number
+#   in a group named "id"
+# - "title" matches a page title, with the manga's title (without the name of
+#   the website) in a group named "title"
+def add_pattern_set(name, anchor, anchor_length, chapter, chapter_end,
+                    section_length, series_link, title):
+
+    pattern_set = {"anchor_length": anchor_length,
+                   "chapter_end_bytes": chapter_end.encode(),
+                   "section_length": section_length}
+
+    # Each pattern is compiled for both text and bytes, since pages that are
+    # read piece by piece are searched before being decoded
+    for pattern_name, pattern in [("anchor", anchor), ("chapter", chapter),
+                                  ("series_link", series_link),
+                                  ("title", title)]:
+        pattern_set[pattern_name] = re.compile(pattern, re.DOTALL)
+        pattern_set[pattern_name + "_bytes"] = re.compile(pattern.encode(),
+                                                          re.DOTALL)
+
+    PATTERN_SETS[name] = pattern_set
+
+
+# Pattern set for the current layout of the manga website (the latest chapter
+# comes shortly after the "Latest Release(s)" heading, and is written as
+# "c.<i>198</i>"); If no chapter is found within 1900 characters of the heading,
+# the section does not list one (14 + 1900 + 5 + 100 + 4 = 2023 characters at
+# most, which is within the section length)
+add_pattern_set(
+    "mangaupdates",
+    anchor=r'Latest Release',
+    anchor_length=14,
+    chapter=r'Latest Release.{0,1900}?c\.<i>(?P<chapter>.{0,100}?)</i>',
+    chapter_end=r'</i>',
+    section_length=2048,
+    series_link=r'series\.html\?id=(?P<id>\d+)',
+    title=(r'^(?:Baka-Updates Manga - )?(?P<title>.*?)'
+           r'(?: - Baka-Updates Manga)?$'))
+
+
+# ---------------------------------------------------------------------------- #
+#                             EXTRACTION FUNCTIONS                             #
+# ---------------------------------------------------------------------------- #
+
+# Function that returns the pattern set with the given name (or the active
+# pattern set, if no name is given)
+def get_pattern_set(pattern_set_name=None):
+
+    if pattern_set_name == None:
+        pattern_set_name = ACTIVE_PATTERN_SET
+
+    return PATTERN_SETS[pattern_set_name]
+
+
+# Function that returns the latest chapter found within a manga's page (given
+# as either text or bytes, with the chapter returned in the same form), or None
+# if the page does not list a chapter
+def find_latest_chapter(page_data, pattern_set_name=None):
+
+    pattern_set = get_pattern_set(pattern_set_name)
+
+    if isinstance(page_data, bytes):
+        match = pattern_set["chapter_bytes"].search(page_data)
+    else:
+        match = pattern_set["chapter"].search(page_data)
+
+    if match == None:
+        return None
+
+    return match.group("chapter")
+
+
+# Function that returns the latest chapter found within a manga's page while
+# the page is still being downloaded (given as pieces of bytes, with the chapter
+# also returned in bytes), or None if the page does not list a chapter; Only as
+# much of the page as needed is read, and each piece is only searched once
+def find_latest_chapter_stream(page_chunks, pattern_set_name=None):
+
+    pattern_set = get_pattern_set(pattern_set_name)
+    anchor_pattern = pattern_set["anchor_bytes"]
+    chapter_pattern = pattern_set["chapter_bytes"]
+    chapter_end = pattern_set["chapter_end_bytes"]
+    section_length = pattern_set["section_length"]
+
+    # Until the section is found, only enough of the page to hold the start of
+    # a split anchor needs to be kept between pieces
+    kept_length = pattern_set["anchor_length"] - 1
+
+    page_data = b"" # Portion of the page that still needs to be searched
+    anchor_found = False # Whether the start of the section has been found
+    searched_length = 0 # Length of the section already searched for its end
+
+    for chunk in page_chunks:
+
+        page_data += chunk
+
+        if anchor_found == False:
+            anchor_match = anchor_pattern.search(page_data)
+
+            if anchor_match == None:
+                page_data = page_data[-kept_length:]
+                continue
+
+            page_data = page_data[anchor_match.start():]
+            anchor_found = True
+
+        # The chapter can only be complete once the text that ends it has
+        # arrived, so only the new part of the section (along with enough of
+        # the old part to hold a split ending) is searched for it; Each time an
+        # ending is found, the section is matched up to that ending, and the
+        # chapter is returned as soon as it is complete (which stops reading
+        # the rest of the page)
+        end_position = page_data.find(chapter_end, max(
+            0, searched_length - len(chapter_end) + 1))
+        searched_length = len(page_data)
+
+        while end_position != -1:
+            chapter_match = chapter_pattern.match(
+                page_data, 0, end_position + len(chapter_end))
+
+            if chapter_match != None:
+                return chapter_match.group("chapter")
+
+            end_position = page_data.find(chapter_end, end_position + 1)
+
+        # Once the section is longer than the chapter pattern can match, the
+        # section does not list a chapter (so the rest of the page is not read)
+        if len(page_data) >= section_length:
+            return None
+
+    return None
+
+
+# Function that returns every manga found within a search result (the JSON
+# text sent back by the search engine), in the order they were found, as a list
+# of dictionaries (each holding the manga's "id", "title", and "link"); Results
+# that do not link to a manga's page (such as pages for authors) are skipped,
+# and the search stops once "limit" manga have been found (if a limit is given)
+def find_search_results(search_result, limit=None, pattern_set_name=None):
+
+    pattern_set = get_pattern_set(pattern_set_name)
+    manga_results = []
+
+    # If the search result could not be decoded (or holds no results), no manga
+    # are returned
+    try:
+        search_items = json.loads(search_result).get("items", [])
+    except (ValueError, AttributeError):
+        return []
+
+    for search_item in search_items:
+
+        if isinstance(search_item, dict) == False:
+            continue
+
+        link = search_item.get("link", "")
+        id_match = pattern_set["series_link"].search(link)
+
+        if id_match == None:
+            continue
+
+        # The name of the website is removed from the title (since it is
+        # sometimes added to the start or end)
+        title = search_item.get("title", "")
+        title = pattern_set["title"].match(title).group("title")
+
+        manga_results.append({"id": id_match.group("id"), "title": title,
+                              "link": link})
+
+        if len(manga_results) == limit:
+            break
+
+    return manga_results
@@ -0,0 +1,63 @@
+# ---------------------------------------------------------------------------- #
+#                                PROGRAM HEADER                                #
+# ---------------------------------------------------------------------------- #
+
+# Name          : conftest.py
+# Description   : Shared setup for Chapter Check's tests (run with "python -m
+#                 pytest"). Each test is given the main program with its
+#                 database, credentials and cache files moved into a temporary
+#                 folder, so that the real files are never touched.
+
+
+# ---------------------------------------------------------------------------- #
+#                               IMPORT STATEMENTS                              #
+# ---------------------------------------------------------------------------- #
+
+import os # Used to build file paths
+import sys # Used to find the main program
+
+import pytest # Used to define the shared setup
+
+# The main program is imported from the folder above this one
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import main as chapter_check
+
+
+# ---------------------------------------------------------------------------- #
+#                                   FIXTURES                                   #
+# ---------------------------------------------------------------------------- #
+
+# Fixture that returns the main program, using a temporary folder for every
+# file it reads or writes (and with every cache emptied)
+@pytest.fixture
+def chapter_check_files(tmp_path, monkeypatch):
+
+    database_dir = str(tmp_path / "database")
+    cache_dir = str(tmp_path / "cache")
+    os.makedirs(database_dir)
+
+    monkeypatch.setattr(chapter_check, "DATABASE_DIR", database_dir)
+    monkeypatch.setattr(chapter_check, "CREDENTIALS_FILE",
+                        database_dir + "/credentials_list.txt")
+    monkeypatch.setattr(chapter_check, "SQLITE_DATABASE_FILE",
+                        database_dir + "/manga_lists.db")
+    monkeypatch.setattr(chapter_check, "STORAGE_BACKEND", "text")
+    monkeypatch.setattr(chapter_check, "credentials_stamp", None)
+
+    monkeypatch.setattr(chapter_check, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(chapter_check, "SERIES_CACHE_FILE",
+                        cache_dir + "/series_pages.json")
+    monkeypatch.setattr(chapter_check, "RELEASE_CADENCE_FILE",
+                        cache_dir + "/release_cadence.json")
+    monkeypatch.setattr(chapter_check, "series_cache", None)
+    monkeypatch.setattr(chapter_check, "release_cadence", None)
+
+    for cache in [chapter_check.chapter_cache, chapter_check.search_cache]:
+        monkeypatch.setitem(cache, "filename", cache_dir + "/" +
+                            os.path.basename(cache["filename"]))
+        monkeypatch.setitem(cache, "entries", None)
+        monkeypatch.setitem(cache, "changed", False)
+
+    return chapter_check
@@ -0,0 +1,62 @@
+# ---------------------------------------------------------------------------- #
+#                                PROGRAM HEADER                                #
+# ---------------------------------------------------------------------------- #
+
+# Name          : test_bulk_import.py
+# Description   : Tests for importing a file of manga titles from the window,
+#                 using a stand-in for the window's canvas (so that no display
+#                 is needed).
+
+
+# ---------------------------------------------------------------------------- #
+#                               IMPORT STATEMENTS                              #
+# ---------------------------------------------------------------------------- #
+
+import queue # Used to build the import's progress queue
+
+
+# ---------------------------------------------------------------------------- #
+#                                TEST FUNCTIONS                                #
+# ---------------------------------------------------------------------------- #
+
+# Canvas that records the functions scheduled with "after", instead of running
+# them
+class FakeCanvas:
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, function, *arguments):
+        self.scheduled.append(function)
+
+
+# If the import fails, polling stops and the error is displayed (rather than
+# the window waiting for the import forever)
+def test_failed_import_stops_polling(chapter_check_files, monkeypatch):
+
+    chapter_check = chapter_check_files
+
+    def failing_import_titles(titles, list_owner, progress_queue=None):
+        progress_queue.put(titles[0])
+        raise OSError("disk full")
+
+    displayed_errors = []
+
+    fake_canvas = FakeCanvas()
+    monkeypatch.setattr(chapter_check, "canvas", fake_canvas, raising=False)
+    monkeypatch.setattr(chapter_check, "import_titles", failing_import_titles)
+    monkeypatch.setattr(chapter_check, "import_error_screen",
+                        displayed_errors.append)
+    monkeypatch.setattr(chapter_check, "show_import_progress",
+                        lambda bulk_import: None)
+
+    bulk_import = {"titles": ["Dr. Stone", "Noragami"], "list_owner": "alice",
+                   "checked": 0, "progress_queue": queue.Queue(),
+                   "summary": None, "error": None}
+
+    chapter_check.run_bulk_import(bulk_import)
+    chapter_check.poll_bulk_import(bulk_import)
+
+    assert fake_canvas.scheduled == []
+    assert bulk_import["checked"] == 1
+    assert [str(error) for error in displayed_errors] == ["disk full"]
@@ -0,0 +1,78 @@
+# ---------------------------------------------------------------------------- #
+#                                PROGRAM HEADER                                #
+# ---------------------------------------------------------------------------- #
+
+# Name          : test_release_cadence.py
+# Description   : Tests for skipping manga that are unlikely to have new
+#                 releases, when the release history is shared by several users.
+
+
+# ---------------------------------------------------------------------------- #
+#                               IMPORT STATEMENTS                              #
+# ---------------------------------------------------------------------------- #
+
+import time # Used to build the release history
+
+
+# ---------------------------------------------------------------------------- #
+#                                TEST FUNCTIONS                                #
+# ---------------------------------------------------------------------------- #
+
+# Function that creates two users ("alice" and "bob") who both list the same
+# manga, where "alice" has already been shown its latest chapter (11) and "bob"
+# has not, along with a release history that says the manga is not due yet
+def create_shared_manga(chapter_check):
+
+    with open(chapter_check.CREDENTIALS_FILE, "w") as credentials_file:
+        credentials_file.write("alice|password\nbob|password\n")
+
+    chapter_check.create_list("alice")
+    chapter_check.update_list([["1", "Shared Manga", "11"]], "alice")
+    chapter_check.create_list("bob")
+    chapter_check.update_list([["1", "Shared Manga", "10"]], "bob")
+
+    current_time = time.time()
+    chapter_check.release_cadence = {
+        "1": {"chapter": "11", "last_changed": current_time - 60,
+              "last_checked": current_time - 60, "interval": 7 * 24 * 60 * 60}}
+
+
+# A manga is skipped for a user who has already seen its latest known chapter,
+# but not for a user whose list still holds an older chapter
+def test_due_when_listed_chapter_is_behind_history(chapter_check_files):
+
+    chapter_check = chapter_check_files
+    create_shared_manga(chapter_check)
+
+    assert chapter_check.select_due_ids(["1"], False, {"1": ["11"]}) == []
+    assert chapter_check.select_due_ids(["1"], False, {"1": ["10"]}) == ["1"]
+    assert chapter_check.select_due_ids(["1"], False,
+                                        {"1": ["11", "10"]}) == ["1"]
+
+
+# Checking "bob" after "alice" has already found chapter 11 still reports (and
+# records) the new chapter on bob's list
+def test_check_command_reports_chapter_found_for_other_user(
+        chapter_check_files, monkeypatch, capsys):
+
+    chapter_check = chapter_check_files
+    create_shared_manga(chapter_check)
+
+    queried_ids = []
+
+    def fake_releases_query_all(id_list):
+        queried_ids.extend(id_list)
+        return ["11" for manga_id in id_list]
+
+    monkeypatch.setattr(chapter_check, "releases_query_all",
+                        fake_releases_query_all)
+
+    assert chapter_check.check_command(["alice"], False) == 0
+    assert queried_ids == []
+
+    assert chapter_check.check_command(["bob"], False) == 0
+    assert queried_ids == ["1"]
+    assert capsys.readouterr().out == "Shared Manga (c. 11)\n"
+    assert chapter_check.get_user_list("bob") == [["1", "Shared Manga", "11"]]
+    assert chapter_check.get_user_list("alice") == [["1", "Shared Manga",
+                                                     "11"]]
@@ -0,0 +1,47 @@
+# ---------------------------------------------------------------------------- #
+#                                PROGRAM HEADER                                #
+# ---------------------------------------------------------------------------- #
+
+# Name          : test_release_scan.py
+# Description   : Tests for searching a manga list for new releases in a
+#                 separate thread.
+
+
+# ---------------------------------------------------------------------------- #
+#                               IMPORT STATEMENTS                              #
+# ---------------------------------------------------------------------------- #
+
+import queue # Used to build the search's result queue
+import threading # Used to build the search's cancel event
+
+
+# ---------------------------------------------------------------------------- #
+#                                TEST FUNCTIONS                                #
+# ---------------------------------------------------------------------------- #
+
+# A query that fails is treated as an unknown chapter, and the end of the
+# search is still signalled (rather than the search thread stopping early)
+def test_failed_query_does_not_stop_search(chapter_check_files, monkeypatch):
+
+    chapter_check = chapter_check_files
+
+    def fake_releases_query(id_num, cancel_event=None):
+        if id_num == "2":
+            raise LookupError("unknown encoding: x-bogus")
+        return "5"
+
+    monkeypatch.setattr(chapter_check, "releases_query", fake_releases_query)
+
+    scan = {"user_list": [["1", "First", "4"], ["2", "Second", "4"]],
+            "due_positions": [0, 1], "result_queue": queue.Queue(),
+            "cancel_event": threading.Event()}
+
+    chapter_check.run_release_scan(scan)
+
+    results = []
+
+    while scan["result_queue"].empty() == False:
+        results.append(scan["result_queue"].get_nowait())
+
+    assert results[-1] == None
+    assert sorted(results[:-1]) == [(0, "5"), (1, None)]
@@ -0,0 +1,56 @@
+# ---------------------------------------------------------------------------- #
+#                                PROGRAM HEADER                                #
+# ---------------------------------------------------------------------------- #
+
+# Name          : test_text_storage.py
+# Description   : Tests for reading manga lists from their snapshot and journal
+#                 files after the program closed part way through a change.
+
+
+# ---------------------------------------------------------------------------- #
+#                                TEST FUNCTIONS                                #
+# ---------------------------------------------------------------------------- #
+
+# Function that creates a user's list with two manga (in the snapshot), and
+# returns the name of the user's journal file
+def create_list_with_journal(chapter_check):
+
+    chapter_check.create_list("alice")
+
+    with open(chapter_check.text_list_filename("alice"), "w") as user_file:
+        user_file.write("88|Berserk|1\n5|Noragami|2\n")
+
+    return chapter_check.text_journal_filename("alice")
+
+
+# An incomplete last line (without a newline character) is left out, and is
+# removed before any new records are added to the journal
+def test_incomplete_last_journal_line_is_ignored(chapter_check_files):
+
+    chapter_check = chapter_check_files
+    journal_filename = create_list_with_journal(chapter_check)
+
+    with open(journal_filename, "w") as journal_file:
+        journal_file.write("U|88|Berserk|3")
+
+    assert chapter_check.get_user_list("alice") == [["88", "Berserk", "1"],
+                                                    ["5", "Noragami", "2"]]
+
+    chapter_check.update_chapters({"5": "7"}, "alice")
+
+    with open(journal_filename, "r") as journal_file:
+        assert journal_file.read() == "U|5|Noragami|7\n"
+
+
+# Records without the right number of fields are skipped
+def test_journal_records_with_wrong_fields_are_skipped(chapter_check_files):
+
+    chapter_check = chapter_check_files
+    journal_filename = create_list_with_journal(chapter_check)
+
+    with open(journal_filename, "w") as journal_file:
+        journal_file.write("A|999\nU|88|Berserk\nR|5|Noragami\n"
+                           "U|88|Berserk|4\n")
+
+    assert chapter_check.get_user_list("alice") == [["88", "Berserk", "4"],
+                                                    ["5", "Noragami", "2"]]